@@ -1,34 +1,45 @@
-import os
-from bs4 import BeautifulSoup
+import re
+
+from file_utils import iter_html_files, write_atomic
 
 # Directory containing your HTML files
 html_dir = '.'
 
+# Root-relative href on an <a> tag. Earlier attribute values are skipped as
+# whole quoted strings so a '>' inside them doesn't end the tag early. The href
+# value may be single-, double- or unquoted; quoted values run to the matching
+# quote, unquoted ones to the next whitespace or '>'.
+HREF_RE = re.compile(
+    rb'(?P<prefix><a\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*?\shref\s*=\s*)'
+    rb'(?:(?P<quote>["\'])(?P<quoted>/(?:(?!(?P=quote))[^>])*)(?P=quote)'
+    rb'|(?P<unquoted>/[^\s>"\'`=<]*))',
+    re.IGNORECASE
+)
+
+def _add_extension(match):
+    quote = match.group('quote') or b''
+    href = match.group('quoted') if quote else match.group('unquoted')
+    # Skip the root URL and already .html URLs
+    if href == b'/' or href.endswith(b'.html'):
+        return match.group(0)
+    return match.group('prefix') + quote + href + b'.html' + quote
+
 def add_html_extension(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        soup = BeautifulSoup(file, 'html.parser')
-        modified = False
-
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            # Skip the root URL and already .html URLs
-            if href.startswith('/') and href != '/' and not href.endswith('.html'):
-                a_tag['href'] = href + '.html'
-                modified = True
-
-    if modified:
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(str(soup))
+    with open(file_path, 'rb') as file:
+        content = file.read()
+
+    # Substitute directly on the raw bytes so the rest of the document is untouched
+    modified_content = HREF_RE.sub(_add_extension, content)
+
+    if modified_content != content:
+        write_atomic(file_path, modified_content)
         print(f"Updated: {file_path}")
     else:
         print(f"No changes: {file_path}")
 
 def main():
-    for root, dirs, files in os.walk(html_dir):
-        for file in files:
-            if file.endswith('.html'):
-                file_path = os.path.join(root, file)
-                add_html_extension(file_path)
+    for file_path in iter_html_files(html_dir):
+        add_html_extension(file_path)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
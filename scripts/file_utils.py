@@ -0,0 +1,45 @@
+import os
+import shutil
+import tempfile
+
+# Directories that never contain site pages; hidden directories are skipped as well
+SKIP_DIRS = frozenset({'node_modules', 'dist', 'scripts', 'images', 'css', 'js'})
+
+def iter_html_files(directory):
+    """Yield HTML file paths under directory, skipping SKIP_DIRS and hidden entries"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Same rule as collect_files, so .git, .venv, .tox etc. never count as site pages
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from iter_html_files(entry.path)
+            elif entry.name.endswith('.html'):
+                yield entry.path
+
+def collect_files(exts, skip_dirs, directory='.'):
+    """Walk directory once, yielding (ext, path) for every file with one of exts"""
+    for root, dirs, files in os.walk(directory):
+        # Prune in place so os.walk never descends into skipped or hidden directories
+        dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith('.')]
+        for file in files:
+            # Hidden files are skipped too, matching glob's '**/*.ext'
+            if file.startswith('.'):
+                continue
+            ext = os.path.splitext(file)[1]
+            if ext in exts:
+                yield ext, os.path.relpath(os.path.join(root, file))
+
+def write_atomic(file_path, data):
+    """Write data to a temp file next to file_path, then swap it into place"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        # mkstemp creates the file private, so carry over the page's own mode
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -1,21 +1,20 @@
-import os
 import subprocess
-import glob
 import shlex
 
+from file_utils import collect_files
+
 # Directory containing your HTML, CSS, and JavaScript files
 project_dir = '.'
 
+# Directories that should never be formatted
+skip_dirs = {'node_modules', 'dist'}
+
 def format_files():
-    # Glob pattern to match files
-    patterns = ['**/*.html', '**/*.css', '**/*.js', '**/*.json', '**/*.md']
+    # File extensions to format
+    exts = {'.html', '.css', '.js', '.json', '.md'}
     
-    # List to hold all matched files
-    files_to_format = []
-
-    # Expand the glob patterns
-    for pattern in patterns:
-        files_to_format.extend(glob.glob(os.path.join(project_dir, pattern), recursive=True))
+    # Collect every matching file in a single walk
+    files_to_format = [path for _, path in collect_files(exts, skip_dirs, project_dir)]
 
     # Command to run Prettier
     prettier_command = ['prettier', '--write'] + files_to_format
@@ -12,14 +12,11 @@ def generate_sourcemap():
     # Create a basic source map
     # This maps the minified file positions to original positions
     # For vanilla JS, we'll create a simple 1:1 mapping
-    lines = js_content.split('\n')
-    mappings = []
-    
-    # Generate basic mappings (1:1 mapping for each line)
-    for line_num in range(len(lines)):
-        # Basic VLQ encoding for the mapping
-        # Format: generated line, generated column, source index, original line, original column
-        mappings.append('AACA')  # Simple 1:1 mapping
+    # Basic VLQ encoding for the mapping
+    # Format: generated line, generated column, source index, original line, original column
+    # Every line gets the same 'AACA' segment, so only the line count is needed
+    line_count = js_content.count('\n') + 1
+    mappings = ('AACA;' * line_count)[:-1]  # Simple 1:1 mapping
     
     map_content = {
         'version': 3,
@@ -27,7 +24,7 @@ def generate_sourcemap():
         'sourceRoot': '',
         'sources': ['webflow-script.js'],
         'names': [],
-        'mappings': ';'.join(mappings),
+        'mappings': mappings,
         'sourcesContent': [js_content]
     }
 
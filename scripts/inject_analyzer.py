@@ -1,30 +1,38 @@
 import os
 import re
 
+from file_utils import write_atomic
+
+# Compiled once; only run on pages that mention webflow-script.js at all
+WEBFLOW_SCRIPT_RE = re.compile(rb'<script[^>]*src="[^"]*webflow-script\.js"[^>]*>')
+
 def inject_analyzer():
     # Read the HTML files
     html_files = [f for f in os.listdir('.') if f.endswith('.html')]
-    
+    analyzer_script = b'<script src="js/analyze-webflow.js"></script>\n  '
+
     for html_file in html_files:
-        with open(html_file, 'r', encoding='utf-8') as f:
+        with open(html_file, 'rb') as f:
             content = f.read()
-        
+
+        # Plain substring check before running the regex; pages that already
+        # load the analyzer (by any path) are left alone so re-runs don't
+        # inject it a second time
+        if b'webflow-script.js' not in content or b'analyze-webflow.js' in content:
+            continue
+
         # Find the webflow-script.js script tag
-        webflow_script = re.search(r'<script[^>]*src="[^"]*webflow-script\.js"[^>]*>', content)
+        webflow_script = WEBFLOW_SCRIPT_RE.search(content)
         if not webflow_script:
             continue
-            
+
         # Add our analyzer script before webflow-script.js
-        analyzer_script = '<script src="js/analyze-webflow.js"></script>'
-        modified_content = content.replace(
-            webflow_script.group(0),
-            analyzer_script + '\n  ' + webflow_script.group(0)
-        )
-        
+        start = webflow_script.start()
+        modified_content = content[:start] + analyzer_script + content[start:]
+
         # Write the modified content back
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
-        
+        write_atomic(html_file, modified_content)
+
         print(f'Injected analyzer into {html_file}')
 
 if __name__ == '__main__':
@@ -1,10 +1,12 @@
 import os
+import asyncio
 import subprocess
-import glob
 import shutil
 from pathlib import Path
 import logging
 
+from file_utils import collect_files
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -12,6 +14,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Output directories already created under dist during this run
+created_dirs = set()
+
 def ensure_node_modules():
     """Ensure required node packages are installed locally"""
     packages = [
@@ -34,14 +39,34 @@ def ensure_dist_directory():
     if os.path.exists('dist'):
         shutil.rmtree('dist')
     os.makedirs('dist')
+    created_dirs.clear()
 
 def create_output_directory(file_path):
     """Create output directory structure in dist"""
     output_dir = os.path.join('dist', os.path.dirname(file_path))
-    os.makedirs(output_dir, exist_ok=True)
+    # Most files share a handful of directories, so only hit the filesystem once each
+    if output_dir not in created_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        created_dirs.add(output_dir)
     return os.path.join('dist', file_path)
 
-def minify_javascript(file_path):
+async def run_minifier(cmd, slots):
+    """Run a minifier without blocking the event loop, raising CalledProcessError on failure"""
+    async with slots:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, cmd,
+            output=stdout.decode(errors='replace'),
+            stderr=stderr.decode(errors='replace')
+        )
+
+async def minify_javascript(file_path, slots):
     """Minify a JavaScript file using terser"""
     try:
         # Skip already minified files
@@ -71,12 +96,7 @@ def minify_javascript(file_path):
             terser_cmd.extend(['--ecma', '2015'])
         
         # Run terser with output capture
-        result = subprocess.run(
-            terser_cmd,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        await run_minifier(terser_cmd, slots)
         
         return output_path
     except subprocess.CalledProcessError as e:
@@ -88,61 +108,112 @@ def minify_javascript(file_path):
         shutil.copy2(file_path, output_path)
         return output_path
 
-def minify_css(file_path):
-    """Minify a CSS file using clean-css"""
-    try:
+def stage_files(file_paths):
+    """Copy original files into dist so a batch minifier can rewrite them in place"""
+    staged = []
+    for file_path in file_paths:
         output_path = create_output_directory(file_path)
-        logger.info(f"Minifying CSS: {file_path}")
-        
+        shutil.copy2(file_path, output_path)
+        staged.append(output_path)
+    return staged
+
+async def minify_css_file(file_path, slots):
+    """Minify a single CSS file using clean-css"""
+    output_path = create_output_directory(file_path)
+    try:
         # Use local cleancss from node_modules
-        subprocess.run([
+        await run_minifier([
             'node_modules/.bin/cleancss',
             '-o', output_path,
             file_path
-        ], check=True, capture_output=True)
-        
-        return output_path
+        ], slots)
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to minify {file_path}: {e}")
         # Copy original file as fallback
         logger.info(f"Using original file as fallback for: {file_path}")
-        output_path = create_output_directory(file_path)
         shutil.copy2(file_path, output_path)
-        return output_path
+    return output_path
 
-def minify_html(file_path):
-    """Minify an HTML file using html-minifier"""
+async def minify_css(file_paths, slots):
+    """Minify CSS files with a single clean-css run"""
+    staged = stage_files(file_paths)
+    if not staged:
+        return staged
     try:
-        output_path = create_output_directory(file_path)
-        logger.info(f"Minifying HTML: {file_path}")
+        logger.info(f"Minifying {len(staged)} CSS files")
         
+        # Use local cleancss from node_modules; an empty batch suffix
+        # overwrites each staged copy with its minified output
+        await run_minifier([
+            'node_modules/.bin/cleancss',
+            '--batch',
+            '--batch-suffix', ''
+        ] + staged, slots)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Failed to minify CSS files as a batch: {e}")
+        # A failed batch can leave staged copies half-written, so restore the
+        # originals and retry one file at a time
+        logger.info("Retrying CSS files one at a time")
+        stage_files(file_paths)
+        await asyncio.gather(*(minify_css_file(f, slots) for f in file_paths))
+    return staged
+
+# Shared html-minifier options for batch and single-file runs
+HTML_MINIFIER_OPTIONS = [
+    '--collapse-whitespace',
+    '--remove-comments',
+    '--remove-optional-tags',
+    '--remove-redundant-attributes',
+    '--remove-script-type-attributes',
+    '--remove-tag-whitespace',
+    '--use-short-doctype',
+    '--minify-css', 'true',
+    '--minify-js', 'false',  # Don't minify inline JS to preserve JSON-LD
+    '--preserve-line-breaks',  # Help preserve JSON-LD formatting
+    '--conservative-collapse',  # More conservative whitespace collapse
+    '--max-line-length', '0',  # Prevent line wrapping
+]
+
+async def minify_html_file(file_path, slots):
+    """Minify a single HTML file using html-minifier"""
+    output_path = create_output_directory(file_path)
+    try:
         # Use local html-minifier from node_modules
-        subprocess.run([
-            'node_modules/.bin/html-minifier',
-            '--collapse-whitespace',
-            '--remove-comments',
-            '--remove-optional-tags',
-            '--remove-redundant-attributes',
-            '--remove-script-type-attributes',
-            '--remove-tag-whitespace',
-            '--use-short-doctype',
-            '--minify-css', 'true',
-            '--minify-js', 'false',  # Don't minify inline JS to preserve JSON-LD
-            '--preserve-line-breaks',  # Help preserve JSON-LD formatting
-            '--conservative-collapse',  # More conservative whitespace collapse
-            '--max-line-length', '0',  # Prevent line wrapping
-            '-o', output_path,
-            file_path
-        ], check=True, capture_output=True)
-        
-        return output_path
+        await run_minifier(
+            ['node_modules/.bin/html-minifier'] + HTML_MINIFIER_OPTIONS +
+            ['-o', output_path, file_path],
+            slots
+        )
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to minify {file_path}: {e}")
         # Copy original file as fallback
         logger.info(f"Using original file as fallback for: {file_path}")
-        output_path = create_output_directory(file_path)
         shutil.copy2(file_path, output_path)
-        return output_path
+    return output_path
+
+async def minify_html(file_paths, slots):
+    """Minify HTML files with a single html-minifier run over dist"""
+    staged = stage_files(file_paths)
+    if not staged:
+        return staged
+    try:
+        logger.info(f"Minifying {len(staged)} HTML files")
+        
+        # Use local html-minifier from node_modules
+        await run_minifier(
+            ['node_modules/.bin/html-minifier'] + HTML_MINIFIER_OPTIONS +
+            ['--input-dir', 'dist', '--output-dir', 'dist', '--file-ext', 'html'],
+            slots
+        )
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Failed to minify HTML files as a batch: {e}")
+        # html-minifier exits on the first bad page, leaving some staged copies
+        # minified and possibly one truncated, so restore the originals and
+        # retry one file at a time
+        logger.info("Retrying HTML files one at a time")
+        stage_files(file_paths)
+        await asyncio.gather(*(minify_html_file(f, slots) for f in file_paths))
+    return staged
 
 def copy_minified_files():
     """Copy minified files from dist back to original locations"""
@@ -156,7 +227,7 @@ def copy_minified_files():
         logger.error(f"Failed to copy minified files: {e}")
         raise
 
-def main():
+async def main():
     try:
         # Ensure required packages are installed
         ensure_node_modules()
@@ -164,37 +235,27 @@ def main():
         # Prepare dist directory
         ensure_dist_directory()
         
-        # Get all files to minify, excluding node_modules and dist
-        js_files = [f for f in glob.glob('**/*.js', recursive=True)
-                   if 'node_modules' not in f and 'dist' not in f]
-        css_files = [f for f in glob.glob('**/*.css', recursive=True)
-                    if 'node_modules' not in f and 'dist' not in f]
-        html_files = [f for f in glob.glob('**/*.html', recursive=True)
-                     if 'node_modules' not in f and 'dist' not in f]
-        
-        # Process JavaScript files
-        for js_file in js_files:
-            try:
-                minify_javascript(js_file)
-            except Exception as e:
-                logger.error(f"Error processing {js_file}: {e}")
-                continue
-        
-        # Process CSS files
-        for css_file in css_files:
-            try:
-                minify_css(css_file)
-            except Exception as e:
-                logger.error(f"Error processing {css_file}: {e}")
-                continue
+        # Get all files to minify in one walk, excluding node_modules and dist
+        files_by_ext = {'.js': [], '.css': [], '.html': []}
+        for ext, file_path in collect_files(files_by_ext, {'node_modules', 'dist'}):
+            files_by_ext[ext].append(file_path)
+        js_files = files_by_ext['.js']
+        css_files = files_by_ext['.css']
+        html_files = files_by_ext['.html']
         
-        # Process HTML files
-        for html_file in html_files:
-            try:
-                minify_html(html_file)
-            except Exception as e:
-                logger.error(f"Error processing {html_file}: {e}")
-                continue
+        # Run the minifier subprocesses concurrently so their Node startups
+        # overlap. terser writes one output per run, while CSS and HTML are
+        # each handled by a single batch run. The semaphore caps how many
+        # subprocesses run at once; it is created here so it belongs to the
+        # loop that asyncio.run started.
+        slots = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+        jobs = [minify_javascript(f, slots) for f in js_files]
+        jobs += [minify_css(css_files, slots), minify_html(html_files, slots)]
+        labels = js_files + ['CSS files', 'HTML files']
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing {label}: {result}")
         
         # Copy minified files back to original locations
         copy_minified_files()
@@ -212,4 +273,4 @@ def main():
         raise
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
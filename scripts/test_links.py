@@ -1,35 +1,58 @@
-import os
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lxml_html
+
+from file_utils import iter_html_files
 
 # Directory containing your HTML files
 html_dir = '.'
 
-def check_url(url):
+# Pages are UTF-8, so skip lxml's encoding detection
+HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+def create_session():
+    """Create a session whose connection pool is large enough for all workers"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def check_url(session, url):
+    """Check a URL and return its status line"""
     try:
-        response = requests.get(url, allow_redirects=True)
-        if response.status_code == 200:
-            print(f"SUCCESS: {url} -> {response.url}")
-        else:
-            print(f"ERROR {response.status_code}: {url}")
+        # Stream so only the headers are read; the body is never downloaded
+        with session.get(url, allow_redirects=True, stream=True) as response:
+            if response.status_code == 200:
+                return f"SUCCESS: {url} -> {response.url}"
+            return f"ERROR {response.status_code}: {url}"
     except requests.exceptions.RequestException as e:
-        print(f"FAILED: {url} - {e}")
+        return f"FAILED: {url} - {e}"
 
-def extract_and_check_links(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        soup = BeautifulSoup(file, 'html.parser')
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            if href.startswith('/'):
-                url = f"http://127.0.0.1:5500{href}"
-                check_url(url)
+def extract_links(file_path):
+    with open(file_path, 'rb') as file:
+        content = file.read()
+    try:
+        tree = lxml_html.document_fromstring(content, parser=HTML_PARSER)
+    except etree.ParserError:
+        # Empty or whitespace-only pages have no links to check
+        return
+    # Only the hrefs are needed, so pull them straight out of the C tree
+    for href in tree.xpath('//a/@href'):
+        if href.startswith('/'):
+            yield f"http://127.0.0.1:5500{href}"
 
 def main():
-    for root, dirs, files in os.walk(html_dir):
-        for file in files:
-            if file.endswith('.html'):
-                file_path = os.path.join(root, file)
-                extract_and_check_links(file_path)
+    # Many pages share the same nav links, so check each URL only once
+    urls = sorted({url for file_path in iter_html_files(html_dir)
+                   for url in extract_links(file_path)})
+
+    # Requests are latency bound, so run them concurrently over one session,
+    # but print from this thread so lines stay whole and in URL order
+    with create_session() as session, ThreadPoolExecutor(max_workers=32) as executor:
+        for line in executor.map(lambda url: check_url(session, url), urls):
+            print(line)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file